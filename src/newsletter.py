@@ -14,21 +14,34 @@ Usage:
 Required environment variable:
     GITHUB_TOKEN             - GitHub token (automatically set in Actions)
 
-Optional environment variable:
+Optional environment variables:
     GITHUB_MODEL             - GitHub Models model to use (default: gpt-5)
+    MAX_ARTICLES_PER_SOURCE  - Newest feed entries considered per source (default: 5)
+    MAX_OUTPUT_TOKENS        - Completion token cap for the model (default: 8000)
+    LLM_TEMPERATURE          - Sampling temperature (default: model default)
+    LLM_CACHE                - Set to 1 to reuse responses for identical prompts
 """
 
+import hashlib
+import html
+import io
+import json
 import os
 import re
 import sys
 import textwrap
+import time
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import feedparser
-import requests
-from bs4 import BeautifulSoup
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
 # ---------------------------------------------------------------------------
 # Sources
@@ -83,10 +96,25 @@ SOURCES = [
 # ---------------------------------------------------------------------------
 
 GITHUB_MODEL = os.environ.get("GITHUB_MODEL") or "gpt-5"
+# For reasoning models this budget also covers hidden reasoning tokens.
+MAX_OUTPUT_TOKENS = int(os.environ.get("MAX_OUTPUT_TOKENS") or 8000)
+# Unset by default: reasoning models such as gpt-5 reject non-default values.
+LLM_TEMPERATURE = (
+    float(os.environ["LLM_TEMPERATURE"]) if os.environ.get("LLM_TEMPERATURE") else None
+)
+LLM_CACHE = os.environ.get("LLM_CACHE") == "1"
 LOOKBACK_HOURS = 24
+MAX_ARTICLES_PER_SOURCE = int(os.environ.get("MAX_ARTICLES_PER_SOURCE") or 5)
+SUMMARY_MAX_CHARS = 500
+SUMMARY_HTML_MAX_CHARS = 4000
 REPO_ROOT = Path(__file__).parent.parent
 NEWSLETTERS_DIR = REPO_ROOT / "newsletters"
 TODAY_FILE = REPO_ROOT / "TODAY.MD"
+CACHE_DIR = NEWSLETTERS_DIR / ".cache"
+FEED_CACHE_FILE = CACHE_DIR / "feeds.json"
+# Bump whenever _parse_feed_entries or _entry_to_article changes its output.
+FEED_CACHE_VERSION = 3
+LLM_CACHE_DIR = CACHE_DIR / "llm"
 ENGLISH_MONTH_NAMES = {
     1: "January",
     2: "February",
@@ -109,66 +137,346 @@ REQUIRED_H2_SECTIONS = (
     "✅ Key Takeaways",
 )
 
+# Static instructions only: keep dates and article data out of this string so
+# the prompt prefix is byte-identical across runs and eligible for caching.
+SYSTEM_PROMPT = textwrap.dedent("""\
+    You are an expert AI and developer-tools journalist.
+
+    The user message gives today's date followed by recent articles from
+    GitHub blogs and AI news pages as a JSON array (fields: s=source, t=title,
+    u=url, sum=summary, p=published). Your task is to write a concise,
+    well-structured daily newsletter in Markdown format.
+
+    Use this exact section structure for a consistent modern look:
+    1. ## ✨ Today's Highlights
+       - one short paragraph (2-4 sentences) covering the top themes.
+    2. ## 🚀 What Changed Today
+       - 3-6 concise bullet points describing meaningful updates.
+    3. ## 📚 Deep Dive by Theme
+       - Use H3 subsections for themes (for example: "GitHub & Copilot",
+         "Foundation Models", "AI Agents & Tooling", "Research", "Other").
+       - For each article, add a bullet with a markdown link, followed by
+         a 1-3 sentence analysis of why it matters and what to watch next.
+    4. ## ✅ Key Takeaways
+       - 3-5 concise bullets.
+
+    Use proper Markdown: headings, bullet points, and hyperlinks.
+    Keep tone professional, modern, and skimmable.
+    Do not add a top-level H1 title because the wrapper already provides it.
+    Do NOT invent facts – only use information from the articles provided.
+    If an article is not relevant to AI or developer tooling, skip it.
+""")
+
+STREAM_PROGRESS_EVERY = 50  # print a progress dot every N streamed chunks
+
+CLIENT_WARMUP_TIMEOUT = 5  # seconds
+# Must outlast the fetch phase (timeouts plus retries) so the warmed model
+# connection is still open when the newsletter is generated.
+CLIENT_KEEPALIVE_EXPIRY = 120  # seconds
 REQUEST_TIMEOUT = 15  # seconds
+FETCH_WORKERS = 8
+FETCH_RETRIES = 2
+FETCH_RETRY_BACKOFF = 0.3  # seconds, doubled after each retry
+FETCH_RETRY_STATUSES = {502, 503, 504}
 REQUEST_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (compatible; the-ai-news-bot/1.0; "
         "+https://github.com/HeyImAllan/the-ai-news)"
-    )
+    ),
+    "Accept-Encoding": "gzip, deflate",
 }
 
+# One HTTP/2 client shared by all fetch workers: requests to the same host
+# (e.g. the three github.blog feeds) are multiplexed over a single TLS
+# connection. The pool must be at least as large as FETCH_WORKERS or threads
+# will block waiting for a free connection to other hosts. The transport only
+# retries failed connects; 5xx gateway errors are retried by _get_with_retries.
+HTTP_CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(
+            max_connections=FETCH_WORKERS, max_keepalive_connections=FETCH_WORKERS
+        ),
+    ),
+    headers=REQUEST_HEADERS,
+    timeout=REQUEST_TIMEOUT,
+    follow_redirects=True,
+)
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_RSS1_NS = "http://purl.org/rss/1.0/"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_FEED_ITEM_TAGS = {"item", f"{{{_RSS1_NS}}}item", f"{{{_ATOM_NS}}}entry"}
+_FEED_CHILD_NAMESPACES = {"", _ATOM_NS, _RSS1_NS, _DC_NS}
+
+# Only tag-like "<" (followed by a letter, "/" or "!") is treated as markup,
+# so literal text such as "<100ms" survives.
+_TAG_RE = re.compile(r"<[A-Za-z/!][^>]*>")
+# A tag cut in half by truncating the raw HTML.
+_DANGLING_TAG_RE = re.compile(r"<[^>]*\Z")
+
 
 # ---------------------------------------------------------------------------
 # Fetching helpers
 # ---------------------------------------------------------------------------
 
 
-def fetch_rss(source: dict) -> tuple[list[dict], str | None]:
+def _load_feed_cache(cache_file: Path = FEED_CACHE_FILE) -> dict[str, dict]:
+    """Load the cached validators and parsed entries per feed URL.
+
+    Returns an empty cache when the file is missing or unreadable.
+    """
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_feed_cache(cache: dict[str, dict], cache_file: Path = FEED_CACHE_FILE) -> None:
+    """Persist the cached validators and parsed entries per feed URL."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_text_atomic(cache_file, json.dumps(cache, ensure_ascii=False))
+
+
+def _strip_html(text: str) -> str:
+    """Strip HTML tags, decode entities and collapse whitespace."""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text)).split())
+
+
+def _entry_to_article(entry: dict, source_name: str) -> dict:
+    """Convert a feedparser entry into an article dict."""
+    # Use published_parsed (UTC time.struct_time) when available
+    published_parsed = entry.get("published_parsed")
+    published_at = None
+    if published_parsed is not None:
+        published_at = datetime(*published_parsed[:6], tzinfo=timezone.utc).isoformat()
+    summary = entry.get("summary", "")
+    if summary:
+        # Markup inflates the visible text several times over, so only the
+        # head of the raw HTML is needed to yield SUMMARY_MAX_CHARS of text.
+        if len(summary) > SUMMARY_HTML_MAX_CHARS:
+            summary = _DANGLING_TAG_RE.sub("", summary[:SUMMARY_HTML_MAX_CHARS])
+        summary = _strip_html(summary)[:SUMMARY_MAX_CHARS]
+    return {
+        "source": source_name,
+        "title": entry.get("title", "").strip(),
+        "url": entry.get("link", ""),
+        "summary": summary,
+        "published": entry.get("published", ""),
+        "published_at": published_at,
+    }
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize an article URL for de-duplication.
+
+    Lower-cases the scheme and host, drops the fragment, tracking (``utm_*``)
+    query parameters and any trailing slash. Malformed URLs are compared as
+    written rather than failing the run.
+    """
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    query = urlencode(
+        [
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if not k.lower().startswith("utm_")
+        ]
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, "")
+    )
+
+
+def _parse_feed_date(text: str) -> time.struct_time | None:
+    """Parse an RFC 822 or ISO 8601 feed date to a UTC struct_time.
+
+    Both formats are tried regardless of the element the date came from,
+    since feeds routinely put ISO dates in RSS ``pubDate``.
+    """
+    for parse in (parsedate_to_datetime, datetime.fromisoformat):
+        try:
+            parsed = parse(text)
+            break
+        except (TypeError, ValueError):
+            continue
+    else:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).timetuple()
+
+
+def _element_text(fields: dict[str, ET.Element], *names: str) -> str:
+    """Return the text of the first of ``names`` present in ``fields``."""
+    for name in names:
+        if name in fields:
+            return "".join(fields[name].itertext()).strip()
+    return ""
+
+
+def _parse_feed_fast(content: bytes, limit: int) -> list[dict]:
+    """Stream the first ``limit`` RSS/Atom entries out of raw feed bytes.
+
+    Returns dicts with the same keys feedparser entries expose (``title``,
+    ``link``, ``summary``, ``published``, ``published_parsed``) so both
+    parsers feed into ``_entry_to_article``. Raises ``ET.ParseError`` when
+    the content is not well-formed XML.
+    """
+    entries: list[dict] = []
+    if limit <= 0:
+        return entries
+    for _, elem in ET.iterparse(io.BytesIO(content), events=("end",)):
+        if elem.tag not in _FEED_ITEM_TAGS:
+            continue
+        fields: dict[str, ET.Element] = {}
+        link = ""
+        for child in elem:
+            namespace, _, name = child.tag.rpartition("}")
+            if namespace.lstrip("{") not in _FEED_CHILD_NAMESPACES:
+                continue
+            if name == "link" and "href" in child.attrib:
+                if not link and child.get("rel", "alternate") == "alternate":
+                    link = child.get("href", "")
+                continue
+            fields.setdefault(name, child)
+        published = _element_text(fields, "pubDate", "published", "date")
+        link = link or _element_text(fields, "link")
+        # Like feedparser, fall back to an RSS guid unless it is marked as
+        # not being a permalink.
+        if not link and fields.get("guid") is not None:
+            if fields["guid"].get("isPermaLink", "true").lower() != "false":
+                link = _element_text(fields, "guid")
+        entries.append(
+            {
+                "title": " ".join(_element_text(fields, "title").split()),
+                "link": link,
+                "summary": _element_text(fields, "description", "summary", "content"),
+                "published": published,
+                "published_parsed": _parse_feed_date(published) if published else None,
+            }
+        )
+        elem.clear()
+        if len(entries) >= limit:
+            break
+    return entries
+
+
+def _parse_feed_entries(
+    content: bytes, source_name: str, limit: int = MAX_ARTICLES_PER_SOURCE
+) -> list[dict]:
+    """Parse raw feed bytes into article dicts, without applying the cutoff.
+
+    Only the first ``limit`` entries are converted, so summary
+    clean-up is never paid for entries that would be dropped anyway.
+
+    ``published_at`` holds the UTC publish time as an ISO string (or None when
+    the entry is undated) so cached entries can be re-filtered on later runs.
+    """
+    try:
+        entries = _parse_feed_fast(content, limit)
+    except ET.ParseError:
+        entries = []
+    # Not well-formed XML (e.g. an HTML page that links to its feed) or an
+    # unrecognised format: let feedparser sniff and auto-discover instead.
+    if not entries:
+        entries = feedparser.parse(content).entries[:limit]
+    return [_entry_to_article(entry, source_name) for entry in entries]
+
+
+def _get_with_retries(
+    http_client: httpx.Client, url: str, headers: dict[str, str]
+) -> httpx.Response:
+    """GET ``url``, retrying transient gateway errors with exponential backoff."""
+    for attempt in range(FETCH_RETRIES + 1):
+        response = http_client.get(url, headers=headers)
+        if response.status_code not in FETCH_RETRY_STATUSES or attempt == FETCH_RETRIES:
+            return response
+        time.sleep(FETCH_RETRY_BACKOFF * 2**attempt)
+    return response
+
+
+def fetch_rss(
+    source: dict,
+    cache: dict[str, dict] | None = None,
+    max_articles: int = MAX_ARTICLES_PER_SOURCE,
+    http_client: httpx.Client = HTTP_CLIENT,
+) -> tuple[list[dict], str | None]:
     """Parse an RSS/Atom feed and return (articles, error_message).
 
     Only articles published within the last LOOKBACK_HOURS hours are included.
+    ``max_articles`` and ``http_client`` are bound as defaults so concurrent
+    workers read them as locals; tests can inject a stub client.
+
+    When ``cache`` is given, the stored ETag/Last-Modified validators are sent
+    with the request. A 304, or a 200 whose body hashes to the cached value,
+    reuses the cached entries without re-parsing; otherwise they are refreshed.
     """
     try:
-        response = requests.get(
-            source["url"], headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-        feed = feedparser.parse(response.content)
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=LOOKBACK_HOURS)
-        articles = []
-        undated_count = 0
-        for entry in feed.entries:
-            # Use published_parsed (UTC time.struct_time) when available
-            published_parsed = entry.get("published_parsed")
-            if published_parsed is not None:
-                published_dt = datetime(*published_parsed[:6], tzinfo=timezone.utc)
-                if published_dt < cutoff:
-                    continue
+        url = source["url"]
+        cached = cache.get(url) if cache is not None else None
+        # Entries parsed under a different per-source limit or by an older
+        # parser cannot be reused.
+        if cached and (
+            cached.get("limit") != max_articles
+            or cached.get("version") != FEED_CACHE_VERSION
+        ):
+            cached = None
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        response = _get_with_retries(http_client, url, headers)
+        cache_status = None
+        if response.status_code == 304 and cached:
+            entries = cached["entries"]
+            cache_status = "not modified"
+        else:
+            response.raise_for_status()
+            content_hash = hashlib.sha256(response.content).hexdigest()
+            if cached and cached.get("content_hash") == content_hash:
+                entries = cached["entries"]
+                cache_status = "unchanged"
             else:
-                undated_count += 1
-            summary = entry.get("summary", "")
-            # Strip HTML tags from summary
-            if summary:
-                summary = BeautifulSoup(summary, "lxml").get_text(
-                    separator=" ", strip=True
+                entries = _parse_feed_entries(
+                    response.content, source["name"], max_articles
                 )
-            articles.append(
-                {
-                    "source": source["name"],
-                    "title": entry.get("title", "").strip(),
-                    "url": entry.get("link", ""),
-                    "summary": summary[:500] if summary else "",
-                    "published": entry.get("published", ""),
+            if cache is not None:
+                cache[url] = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "content_hash": content_hash,
+                    "limit": max_articles,
+                    "version": FEED_CACHE_VERSION,
+                    "entries": entries,
                 }
-            )
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=LOOKBACK_HOURS)
+        articles = [
+            entry
+            for entry in entries
+            if entry["published_at"] is None
+            or datetime.fromisoformat(entry["published_at"]) >= cutoff
+        ]
+        undated_count = sum(1 for article in articles if article["published_at"] is None)
         dated_count = len(articles) - undated_count
         msg = f"  ✓ {source['name']}: fetched {len(articles)} article(s) from the last {LOOKBACK_HOURS}h"
         if undated_count:
             msg += f" ({dated_count} dated, {undated_count} undated)"
+        if cache_status:
+            msg += f" [{cache_status}]"
         print(msg, flush=True)
         return articles, None
     except Exception as exc:  # noqa: BLE001
-        error_msg = str(exc)
+        # httpx appends a multi-line "For more information" hint; keep the
+        # first line only since this message ends up in the newsletter.
+        error_msg = str(exc).split("\n", 1)[0]
         print(f"  ✗ {source['name']}: {error_msg}", flush=True)
         return [], error_msg
 
@@ -182,13 +490,42 @@ def fetch_all_articles() -> tuple[list[dict], dict[str, str]]:
     all_articles: list[dict] = []
     failed_sources: dict[str, str] = {}
     print("Fetching articles…")
-    for source in SOURCES:
-        articles, error = fetch_rss(source)
+    cache = _load_feed_cache()
+    # Feeds are fetched concurrently; results are merged back in SOURCES order
+    # so the newsletter output stays deterministic. Each worker only touches
+    # its own URL key in the shared cache dict.
+    results: dict[int, tuple[list[dict], str | None]] = {}
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_rss, source, cache): index
+            for index, source in enumerate(SOURCES)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    for index, source in enumerate(SOURCES):
+        articles, error = results[index]
         all_articles.extend(articles)
         if error is not None:
             failed_sources[source["name"]] = error
-    print(f"Total articles fetched: {len(all_articles)}\n")
-    return all_articles, failed_sources
+    try:
+        _save_feed_cache(cache)
+    except OSError as exc:
+        print(f"  ⚠️ Could not save feed cache: {exc}", flush=True)
+    # Overlapping feeds (e.g. a Copilot post also in the main GitHub Blog
+    # feed) would otherwise be sent to the model twice.
+    seen: set[str] = set()
+    deduped: list[dict] = []
+    for article in all_articles:
+        key = _canonical_url(article["url"])
+        if key and key not in seen:
+            seen.add(key)
+            deduped.append(article)
+    dropped = len(all_articles) - len(deduped)
+    msg = f"Total articles fetched: {len(deduped)}"
+    if dropped:
+        msg += f" ({dropped} duplicate or link-less skipped)"
+    print(msg + "\n")
+    return deduped, failed_sources
 
 
 # ---------------------------------------------------------------------------
@@ -196,74 +533,142 @@ def fetch_all_articles() -> tuple[list[dict], dict[str, str]]:
 # ---------------------------------------------------------------------------
 
 
-def build_prompt(articles: list[dict]) -> str:
-    """Build the prompt that will be sent to the LLM."""
-    article_lines = []
-    for i, article in enumerate(articles, start=1):
-        lines = [
-            f"[{i}] Source: {article['source']}",
-            f"    Title: {article['title']}",
-            f"    URL: {article['url']}",
-        ]
-        # Truncate summary to 100 chars in the prompt to stay within model token limits
-        summary = article["summary"]
-        if summary:
-            lines.append(f"    Summary: {summary[:100]}")
-        article_lines.append("\n".join(lines))
-
-    articles_block = "\n\n".join(article_lines)
-
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-
-    return textwrap.dedent(f"""\
-        You are an expert AI and developer-tools journalist.
-
-        Today is {today}.
-
-        Below is a list of recent articles from GitHub blogs and AI news pages.
-        Your task is to write a concise, well-structured daily newsletter in
-        Markdown format that:
-
-        Use this exact section structure for a consistent modern look:
-        1. ## ✨ Today's Highlights
-           - one short paragraph (2-4 sentences) covering the top themes.
-        2. ## 🚀 What Changed Today
-           - 3-6 concise bullet points describing meaningful updates.
-        3. ## 📚 Deep Dive by Theme
-           - Use H3 subsections for themes (for example: "GitHub & Copilot",
-             "Foundation Models", "AI Agents & Tooling", "Research", "Other").
-           - For each article, add a bullet with a markdown link, followed by
-             a 1-3 sentence analysis of why it matters and what to watch next.
-        4. ## ✅ Key Takeaways
-           - 3-5 concise bullets.
-
-        Use proper Markdown: headings, bullet points, and hyperlinks.
-        Keep tone professional, modern, and skimmable.
-        Do not add a top-level H1 title because the wrapper already provides it.
-        Do NOT invent facts – only use information from the articles provided.
-        If an article is not relevant to AI or developer tooling, skip it.
+def build_prompt(
+    articles: list[dict], now: datetime | None = None
+) -> list[dict[str, str]]:
+    """Build the chat messages that will be sent to the LLM.
 
-        ---
+    The static instructions go in the system message and everything that
+    changes between runs (date, articles) goes in the user message, so the
+    provider can serve the shared prefix from its prompt cache.
+    """
+    # Compact JSON with short keys (documented in SYSTEM_PROMPT) costs far
+    # fewer tokens than labelled lines. Summaries are truncated to 100 chars
+    # to stay within model token limits.
+    articles_block = json.dumps(
+        [
+            {
+                "s": article["source"],
+                "t": article["title"],
+                "u": article["url"],
+                "sum": article["summary"][:100],
+                "p": article["published"],
+            }
+            for article in articles
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
 
-        ARTICLES:
+    now = now or datetime.now(timezone.utc)
+    today = now.strftime("%B %d, %Y")
 
-        {articles_block}
-    """)
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"Today is {today}.\n\nARTICLES:\n\n{articles_block}\n"},
+    ]
+
+
+def create_models_client(github_token: str) -> OpenAI:
+    """Create the GitHub Models client and open its connection ahead of use.
+
+    The warm-up request only exists to pay for DNS and the TLS handshake
+    early; its result (or failure) is ignored.
+    """
+    # GitHub Models is OpenAI-SDK-compatible; only the base_url differs.
+    # The SDK's default pool drops idle connections after 5s, which would
+    # discard the warmed connection long before fetching finishes.
+    client = OpenAI(
+        base_url="https://models.inference.ai.azure.com",
+        api_key=github_token,
+        http_client=DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=10,
+                keepalive_expiry=CLIENT_KEEPALIVE_EXPIRY,
+            )
+        ),
+    )
+    try:
+        client.with_options(timeout=CLIENT_WARMUP_TIMEOUT, max_retries=0).models.list()
+    except Exception:  # noqa: BLE001
+        pass
+    return client
 
 
-def generate_newsletter(articles: list[dict], client: OpenAI) -> str:
+def generate_newsletter(
+    articles: list[dict], client: OpenAI, now: datetime | None = None
+) -> str:
     """Send articles to GitHub Models and return the generated newsletter text."""
     if not articles:
         raise ValueError("No articles to summarize.")
 
     print(f"Generating newsletter with {GITHUB_MODEL}…")
-    prompt = build_prompt(articles)
-
+    messages = build_prompt(articles, now)
+    options = {}
+    if LLM_TEMPERATURE is not None:
+        options["temperature"] = LLM_TEMPERATURE
+
+    cache_path = None
+    if LLM_CACHE:
+        # Exact-match cache: any change to the model, settings or prompt
+        # (including the date in the user message) produces a new key.
+        cache_key = hashlib.sha256(
+            json.dumps(
+                [GITHUB_MODEL, MAX_OUTPUT_TOKENS, options, messages], ensure_ascii=False
+            ).encode("utf-8")
+        ).hexdigest()
+        cache_path = LLM_CACHE_DIR / f"{cache_key}.md"
+        if cache_path.exists():
+            print(f"  Using cached response: {cache_path.name}")
+            return normalize_newsletter_body(cache_path.read_text(encoding="utf-8"))
+
+    # Stream so network failures surface as soon as they happen rather than
+    # after the whole generation; usage arrives in a final choice-less chunk.
     response = client.chat.completions.create(
         model=GITHUB_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=messages,
+        max_completion_tokens=MAX_OUTPUT_TOKENS,
+        stream=True,
+        stream_options={"include_usage": True},
+        **options,
     )
-    return normalize_newsletter_body(response.choices[0].message.content.strip())
+    buf = io.StringIO()
+    finish_reason = None
+    for chunk_count, chunk in enumerate(response, start=1):
+        if chunk.choices:
+            choice = chunk.choices[0]
+            if choice.delta.content:
+                buf.write(choice.delta.content)
+            if choice.finish_reason:
+                finish_reason = choice.finish_reason
+        if chunk.usage is not None:
+            log_prompt_cache_usage(chunk.usage)
+        if chunk_count % STREAM_PROGRESS_EVERY == 0:
+            print(".", end="", flush=True)
+    print()
+    body = buf.getvalue().strip()
+    # With reasoning models the cap also covers hidden reasoning tokens, so a
+    # long reasoning pass can leave the newsletter truncated or empty. Fail
+    # rather than publish (and cache) placeholder sections.
+    if finish_reason == "length":
+        raise RuntimeError(
+            f"Model output hit the {MAX_OUTPUT_TOKENS}-token limit "
+            f"({len(body)} chars generated); raise MAX_OUTPUT_TOKENS and retry."
+        )
+
+    if cache_path is not None and body:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_text_atomic(cache_path, body)
+    return normalize_newsletter_body(body)
+
+
+def log_prompt_cache_usage(usage) -> None:
+    """Print how many prompt tokens were served from the provider's cache."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached_tokens = getattr(details, "cached_tokens", None)
+    if cached_tokens is not None:
+        print(f"  Prompt tokens: {usage.prompt_tokens} ({cached_tokens} cached)")
 
 
 # ---------------------------------------------------------------------------
@@ -271,24 +676,37 @@ def generate_newsletter(articles: list[dict], client: OpenAI) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _write_text_atomic(path: Path, content: str) -> None:
+    """Write UTF-8 text to ``path`` so readers never see a partial file.
+
+    The content goes to a sibling temp file first and is then moved into
+    place with ``os.replace``, which is atomic on the same filesystem.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(content.encode("utf-8"))
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp_path, path)
+
+
 def build_recent_headlines_section(
     articles: list[dict], failed_sources: dict[str, str]
 ) -> str:
     """Build a Markdown section listing recent headlines grouped by source."""
-    by_source: dict[str, list[dict]] = {}
+    by_source: dict[str, list[dict]] = defaultdict(list)
     for article in articles:
-        by_source.setdefault(article["source"], []).append(article)
+        by_source[article["source"]].append(article)
 
     lines = ["## 📰 Recent Headlines by Source", ""]
     for source_name, source_articles in by_source.items():
         lines.append(f"### {source_name}")
-        for article in source_articles:
-            title = article["title"] or "(no title)"
-            url = article["url"]
-            if url:
-                lines.append(f"- [{title}]({url})")
-            else:
-                lines.append(f"- {title}")
+        lines.extend(
+            f"- [{article['title'] or '(no title)'}]({article['url']})"
+            if article["url"]
+            else f"- {article['title'] or '(no title)'}"
+            for article in source_articles
+        )
         lines.append("")
 
     if failed_sources:
@@ -301,10 +719,14 @@ def build_recent_headlines_section(
 
 
 def wrap_newsletter(
-    body: str, article_count: int, articles: list[dict], failed_sources: dict[str, str]
+    body: str,
+    article_count: int,
+    articles: list[dict],
+    failed_sources: dict[str, str],
+    now: datetime | None = None,
 ) -> str:
     """Add a standard header/footer to the LLM-generated body."""
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     date_str = now.strftime("%B %d, %Y")
     filename_date = now.strftime("%Y-%m-%d")
 
@@ -332,18 +754,19 @@ model: {GITHUB_MODEL}*
     return header + body + "\n\n" + recent_headlines + footer
 
 
-def save_newsletter(content: str) -> Path:
+def save_newsletter(content: str, now: datetime | None = None) -> Path:
     """Write the newsletter to the newsletters/ directory and return the path."""
     NEWSLETTERS_DIR.mkdir(parents=True, exist_ok=True)
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    now = now or datetime.now(timezone.utc)
+    date_str = now.strftime("%Y-%m-%d")
     output_path = NEWSLETTERS_DIR / f"{date_str}.md"
-    output_path.write_text(content, encoding="utf-8")
+    _write_text_atomic(output_path, content)
     return output_path
 
 
 def save_today_markdown(content: str, today_file: Path = TODAY_FILE) -> Path:
     """Write today's generated newsletter to TODAY.MD in the repository root."""
-    today_file.write_text(content, encoding="utf-8")
+    _write_text_atomic(today_file, content)
     return today_file
 
 
@@ -451,7 +874,7 @@ def compact_previous_month_news(
     )
     lines.append("")
 
-    overview_path.write_text("\n".join(lines), encoding="utf-8")
+    _write_text_atomic(overview_path, "\n".join(lines))
     return overview_path
 
 
@@ -466,23 +889,30 @@ def main() -> None:
         print("ERROR: GITHUB_TOKEN environment variable is not set.", file=sys.stderr)
         sys.exit(1)
 
-    # GitHub Models is OpenAI-SDK-compatible; only the base_url differs.
-    client = OpenAI(
-        base_url="https://models.inference.ai.azure.com",
-        api_key=github_token,
-    )
+    # A single timestamp keeps the filename and in-content dates consistent
+    # even when a run straddles midnight UTC.
+    now = datetime.now(timezone.utc)
 
-    monthly_overview_path = compact_previous_month_news()
+    # Build the model client (and its DNS/TLS connection) in the background
+    # so it is ready by the time fetching finishes.
+    executor = ThreadPoolExecutor(max_workers=1)
+    client_future = executor.submit(create_models_client, github_token)
+    executor.shutdown(wait=False)
+
+    monthly_overview_path = compact_previous_month_news(now)
     articles, failed_sources = fetch_all_articles()
+    client = client_future.result()
     if not articles:
         if monthly_overview_path:
             print(f"✅ Monthly overview saved to: {monthly_overview_path}")
         print("No articles fetched from any source. Skipping newsletter generation.")
         sys.exit(0)
 
-    newsletter_body = generate_newsletter(articles, client)
-    full_newsletter = wrap_newsletter(newsletter_body, len(articles), articles, failed_sources)
-    output_path = save_newsletter(full_newsletter)
+    newsletter_body = generate_newsletter(articles, client, now)
+    full_newsletter = wrap_newsletter(
+        newsletter_body, len(articles), articles, failed_sources, now
+    )
+    output_path = save_newsletter(full_newsletter, now)
     today_path = save_today_markdown(full_newsletter)
 
     print(f"\n✅ Newsletter saved to: {output_path}")
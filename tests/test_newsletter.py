@@ -1,12 +1,25 @@
+import hashlib
+import json
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from src import newsletter
 
 
+def stream_chunk(content, finish_reason=None):
+    """Build a minimal streamed chat-completion chunk."""
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+        ],
+        usage=None,
+    )
+
+
 class MainTests(unittest.TestCase):
     @patch("src.newsletter.compact_previous_month_news")
     @patch("src.newsletter.save_today_markdown")
@@ -65,12 +78,29 @@ class MainTests(unittest.TestCase):
             newsletter.main()
 
         mock_openai.assert_called_once()
-        mock_generate_newsletter.assert_called_once_with(articles, mock_openai.return_value)
-        mock_wrap_newsletter.assert_called_once_with("body", len(articles), articles, {})
-        mock_save_newsletter.assert_called_once_with("wrapped")
+        (now,), _ = mock_compact_previous_month_news.call_args
+        mock_generate_newsletter.assert_called_once_with(
+            articles, mock_openai.return_value, now
+        )
+        mock_wrap_newsletter.assert_called_once_with("body", len(articles), articles, {}, now)
+        mock_save_newsletter.assert_called_once_with("wrapped", now)
         mock_save_today_markdown.assert_called_once_with("wrapped")
         mock_compact_previous_month_news.assert_called_once()
 
+    @patch("src.newsletter.DefaultHttpxClient")
+    @patch("src.newsletter.OpenAI")
+    def test_create_models_client_ignores_warmup_failure(self, mock_openai, mock_http_client):
+        warm_client = mock_openai.return_value.with_options.return_value
+        warm_client.models.list.side_effect = RuntimeError("offline")
+
+        client = newsletter.create_models_client("test-token")
+
+        self.assertIs(client, mock_openai.return_value)
+        warm_client.models.list.assert_called_once()
+        _, kwargs = mock_http_client.call_args
+        self.assertEqual(kwargs["limits"].keepalive_expiry, newsletter.CLIENT_KEEPALIVE_EXPIRY)
+        self.assertEqual(mock_openai.call_args.kwargs["http_client"], mock_http_client.return_value)
+
     def test_main_exits_when_github_token_missing(self):
         with patch.dict("os.environ", {}, clear=True):
             with self.assertRaises(SystemExit) as context:
@@ -79,6 +109,243 @@ class MainTests(unittest.TestCase):
         self.assertEqual(context.exception.code, 1)
 
 
+class FetchTests(unittest.TestCase):
+    def test_fetch_all_articles_merges_results_in_source_order(self):
+        sources = [{"name": "A", "url": "a"}, {"name": "B", "url": "b"}, {"name": "C", "url": "c"}]
+
+        def fake_fetch_rss(source, cache):
+            if source["name"] == "B":
+                return [], "boom"
+            return [{"source": source["name"], "url": source["url"]}], None
+
+        with patch.object(newsletter, "SOURCES", sources), patch(
+            "src.newsletter.fetch_rss", side_effect=fake_fetch_rss
+        ), patch("src.newsletter._load_feed_cache", return_value={}), patch(
+            "src.newsletter._save_feed_cache"
+        ):
+            articles, failed_sources = newsletter.fetch_all_articles()
+
+        self.assertEqual([a["source"] for a in articles], ["A", "C"])
+        self.assertEqual(failed_sources, {"B": "boom"})
+
+    def test_fetch_all_articles_drops_duplicate_and_link_less_articles(self):
+        sources = [{"name": "A", "url": "a"}, {"name": "B", "url": "b"}]
+        results = {
+            "A": [
+                {"source": "A", "url": "https://github.blog/post/?utm_source=feed"},
+                {"source": "A", "url": ""},
+            ],
+            "B": [
+                {"source": "B", "url": "https://GitHub.blog/post#comments"},
+                {"source": "B", "url": "https://github.blog/other/"},
+            ],
+        }
+
+        with patch.object(newsletter, "SOURCES", sources), patch(
+            "src.newsletter.fetch_rss",
+            side_effect=lambda source, cache: (results[source["name"]], None),
+        ), patch("src.newsletter._load_feed_cache", return_value={}), patch(
+            "src.newsletter._save_feed_cache"
+        ):
+            articles, _ = newsletter.fetch_all_articles()
+
+        self.assertEqual(
+            [a["url"] for a in articles],
+            ["https://github.blog/post/?utm_source=feed", "https://github.blog/other/"],
+        )
+
+    def test_canonical_url_handles_malformed_and_valueless_params(self):
+        self.assertEqual(newsletter._canonical_url(" https://[x/1 "), "https://[x/1")
+        self.assertNotEqual(
+            newsletter._canonical_url("https://a.com/p?ref"),
+            newsletter._canonical_url("https://a.com/p"),
+        )
+
+    def test_fetch_rss_reuses_cached_entries_on_not_modified(self):
+        mock_client = MagicMock()
+        source = {"name": "A", "url": "https://example.com/feed"}
+        recent = datetime.now(timezone.utc).isoformat()
+        cache = {
+            source["url"]: {
+                "etag": '"abc"',
+                "last_modified": None,
+                "limit": newsletter.MAX_ARTICLES_PER_SOURCE,
+                "version": newsletter.FEED_CACHE_VERSION,
+                "entries": [
+                    {"source": "A", "title": "New", "url": "u1", "summary": "",
+                     "published": "", "published_at": recent},
+                    {"source": "A", "title": "Old", "url": "u2", "summary": "",
+                     "published": "", "published_at": "2000-01-01T00:00:00+00:00"},
+                ],
+            }
+        }
+        mock_client.get.return_value.status_code = 304
+
+        articles, error = newsletter.fetch_rss(source, cache, http_client=mock_client)
+
+        self.assertIsNone(error)
+        self.assertEqual([a["title"] for a in articles], ["New"])
+        _, kwargs = mock_client.get.call_args
+        self.assertEqual(kwargs["headers"], {"If-None-Match": '"abc"'})
+
+    @patch("src.newsletter._parse_feed_entries")
+    def test_fetch_rss_skips_parsing_when_body_is_unchanged(self, mock_parse_feed_entries):
+        mock_client = MagicMock()
+        source = {"name": "A", "url": "https://example.com/feed"}
+        body = b"<rss></rss>"
+        cache = {
+            source["url"]: {
+                "etag": None,
+                "last_modified": None,
+                "content_hash": hashlib.sha256(body).hexdigest(),
+                "limit": newsletter.MAX_ARTICLES_PER_SOURCE,
+                "version": newsletter.FEED_CACHE_VERSION,
+                "entries": [
+                    {"source": "A", "title": "Undated", "url": "u", "summary": "",
+                     "published": "", "published_at": None},
+                ],
+            }
+        }
+        response = mock_client.get.return_value
+        response.status_code = 200
+        response.content = body
+        response.headers = {}
+
+        articles, error = newsletter.fetch_rss(source, cache, http_client=mock_client)
+
+        self.assertIsNone(error)
+        self.assertEqual([a["title"] for a in articles], ["Undated"])
+        mock_parse_feed_entries.assert_not_called()
+
+    def test_parse_feed_entries_reads_rss_and_atom(self):
+        rss = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>c</title>
+<item><title>Post</title><link>https://a.com/1</link>
+<description>&lt;p&gt;Some &lt;b&gt;bold&lt;/b&gt; text&lt;/p&gt;</description>
+<pubDate>Tue, 14 Oct 2026 10:00:00 +0200</pubDate></item></channel></rss>"""
+        atom = b"""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>Entry</title><link rel="replies" href="https://b.com/c"/>
+<link rel="alternate" href="https://b.com/1"/><summary>sum</summary></entry></feed>"""
+
+        (rss_article,) = newsletter._parse_feed_entries(rss, "A")
+        (atom_article,) = newsletter._parse_feed_entries(atom, "B")
+
+        self.assertEqual(rss_article["title"], "Post")
+        self.assertEqual(rss_article["url"], "https://a.com/1")
+        self.assertEqual(rss_article["summary"], "Some bold text")
+        self.assertEqual(rss_article["published_at"], "2026-10-14T08:00:00+00:00")
+        self.assertEqual(atom_article["url"], "https://b.com/1")
+        self.assertEqual(atom_article["summary"], "sum")
+        self.assertIsNone(atom_article["published_at"])
+
+    def test_parse_feed_entries_uses_permalink_guid_as_link(self):
+        rss = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+<item><title>Perma</title><guid isPermaLink="true">https://a.com/1</guid></item>
+<item><title>Implicit</title><guid>https://a.com/2</guid></item>
+<item><title>Opaque</title><guid isPermaLink="false">tag:a.com,2026:3</guid></item>
+</channel></rss>"""
+
+        articles = newsletter._parse_feed_entries(rss, "A")
+
+        self.assertEqual(
+            [a["url"] for a in articles], ["https://a.com/1", "https://a.com/2", ""]
+        )
+
+    @patch("src.newsletter.time.sleep")
+    def test_fetch_rss_retries_transient_gateway_errors(self, mock_sleep):
+        unavailable = MagicMock(status_code=503)
+        ok = MagicMock(status_code=200, headers={})
+        ok.content = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+<item><title>Post</title><link>https://a.com/1</link></item></channel></rss>"""
+        mock_client = MagicMock()
+        mock_client.get.side_effect = [unavailable, unavailable, ok]
+
+        articles, error = newsletter.fetch_rss(
+            {"name": "A", "url": "https://a.com/feed"}, http_client=mock_client
+        )
+
+        self.assertIsNone(error)
+        self.assertEqual([a["title"] for a in articles], ["Post"])
+        self.assertEqual(mock_client.get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch("src.newsletter._parse_feed_entries", return_value=[])
+    def test_fetch_rss_reparses_entries_from_older_cache_version(self, mock_parse_feed_entries):
+        body = b"<rss></rss>"
+        source = {"name": "A", "url": "https://example.com/feed"}
+        cache = {
+            source["url"]: {
+                "etag": '"abc"',
+                "last_modified": None,
+                "content_hash": hashlib.sha256(body).hexdigest(),
+                "limit": newsletter.MAX_ARTICLES_PER_SOURCE,
+                "entries": [
+                    {"source": "A", "title": "Stale", "url": "u", "summary": "",
+                     "published": "", "published_at": None},
+                ],
+            }
+        }
+        mock_client = MagicMock()
+        response = mock_client.get.return_value
+        response.status_code = 200
+        response.content = body
+        response.headers = {}
+
+        articles, error = newsletter.fetch_rss(source, cache, http_client=mock_client)
+
+        self.assertIsNone(error)
+        self.assertEqual(articles, [])
+        mock_parse_feed_entries.assert_called_once()
+        _, kwargs = mock_client.get.call_args
+        self.assertEqual(kwargs["headers"], {})
+        self.assertEqual(cache[source["url"]]["version"], newsletter.FEED_CACHE_VERSION)
+
+    def test_fetch_rss_filters_old_iso_pubdate(self):
+        mock_client = MagicMock()
+        response = mock_client.get.return_value
+        response.status_code = 200
+        response.headers = {}
+        response.content = b"""<?xml version="1.0"?><rss version="2.0"><channel>
+<item><title>Old</title><link>https://a.com/1</link>
+<pubDate>2020-01-01T00:00:00Z</pubDate></item></channel></rss>"""
+
+        articles, error = newsletter.fetch_rss(
+            {"name": "A", "url": "https://a.com/feed"}, http_client=mock_client
+        )
+
+        self.assertIsNone(error)
+        self.assertEqual(articles, [])
+
+    @patch("src.newsletter.feedparser.parse")
+    def test_parse_feed_entries_falls_back_to_feedparser(self, mock_parse):
+        mock_parse.return_value.entries = [{"title": "Discovered", "link": "https://c.com"}]
+
+        articles = newsletter._parse_feed_entries(b"<html><p>not a feed</html>", "C")
+
+        self.assertEqual([a["title"] for a in articles], ["Discovered"])
+
+    def test_strip_html_removes_tags_and_decodes_entities(self):
+        self.assertEqual(
+            newsletter._strip_html("<p>Hello&nbsp;<b>world</b> &amp;\n  more</p>"),
+            "Hello world & more",
+        )
+        self.assertEqual(
+            newsletter._strip_html("Cuts latency to <100ms on H100s"),
+            "Cuts latency to <100ms on H100s",
+        )
+        self.assertEqual(
+            newsletter._strip_html("if a<b then c, else d"), "if a<b then c, else d"
+        )
+
+    def test_entry_to_article_drops_tag_cut_by_truncation(self):
+        # Markup-only head so the cut lands inside the <a> tag below.
+        head = "<br>" * ((newsletter.SUMMARY_HTML_MAX_CHARS - 8) // 4 - 1) + "word"
+        article = newsletter._entry_to_article(
+            {"summary": head + '<a href="https://example.com">link</a>'}, "A"
+        )
+
+        self.assertEqual(article["summary"], "word")
+
+
 class OutputHelpersTests(unittest.TestCase):
     def test_normalize_newsletter_body_enforces_required_sections(self):
         normalized = newsletter.normalize_newsletter_body(
@@ -96,15 +363,88 @@ Summary paragraph.
         self.assertIn("## ✅ Key Takeaways", normalized)
 
     def test_build_prompt_includes_consistent_modern_template_sections(self):
-        prompt = newsletter.build_prompt(
+        system_message, user_message = newsletter.build_prompt(
             [{"source": "A", "title": "T", "url": "U", "summary": "S", "published": ""}]
         )
+        prompt = system_message["content"]
 
+        self.assertEqual(system_message["role"], "system")
         self.assertIn("## ✨ Today's Highlights", prompt)
         self.assertIn("## 🚀 What Changed Today", prompt)
         self.assertIn("## 📚 Deep Dive by Theme", prompt)
         self.assertIn("## ✅ Key Takeaways", prompt)
         self.assertIn("Do not add a top-level H1 title", prompt)
+        self.assertEqual(user_message["role"], "user")
+        self.assertIn("Today is", user_message["content"])
+        articles_json = user_message["content"].split("ARTICLES:", 1)[1]
+        self.assertEqual(
+            json.loads(articles_json), [{"s": "A", "t": "T", "u": "U", "sum": "S", "p": ""}]
+        )
+
+    def test_generate_newsletter_accumulates_streamed_chunks(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter(
+            [stream_chunk("## Key "), stream_chunk(None), stream_chunk("Takeaways\n- done")]
+        )
+
+        body = newsletter.generate_newsletter(
+            [{"source": "A", "title": "T", "url": "U", "summary": "S", "published": ""}],
+            client,
+        )
+
+        self.assertIn("## ✅ Key Takeaways\n- done", body)
+        _, kwargs = client.chat.completions.create.call_args
+        self.assertTrue(kwargs["stream"])
+        self.assertEqual(kwargs["max_completion_tokens"], newsletter.MAX_OUTPUT_TOKENS)
+        self.assertNotIn("temperature", kwargs)
+
+    def test_generate_newsletter_fails_and_skips_cache_when_output_truncated(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter(
+            [stream_chunk("## Today", finish_reason="length")]
+        )
+
+        with TemporaryDirectory() as tmp_dir, patch.object(
+            newsletter, "LLM_CACHE", True
+        ), patch.object(newsletter, "LLM_CACHE_DIR", Path(tmp_dir)):
+            with self.assertRaises(RuntimeError):
+                newsletter.generate_newsletter(
+                    [{"source": "A", "title": "T", "url": "U", "summary": "S", "published": ""}],
+                    client,
+                )
+            self.assertEqual(list(Path(tmp_dir).iterdir()), [])
+
+    def test_generate_newsletter_reuses_cached_response_when_enabled(self):
+        articles = [{"source": "A", "title": "T", "url": "U", "summary": "S", "published": ""}]
+        now = datetime(2026, 4, 1, tzinfo=timezone.utc)
+        client = MagicMock()
+        client.chat.completions.create.return_value = iter(
+            [stream_chunk("cached body", finish_reason="stop")]
+        )
+
+        with TemporaryDirectory() as tmp_dir, patch.object(
+            newsletter, "LLM_CACHE", True
+        ), patch.object(newsletter, "LLM_CACHE_DIR", Path(tmp_dir)):
+            first = newsletter.generate_newsletter(articles, client, now)
+            second = newsletter.generate_newsletter(articles, client, now)
+
+        self.assertEqual(first, second)
+        self.assertIn("cached body", second)
+        client.chat.completions.create.assert_called_once()
+
+    def test_build_recent_headlines_section_groups_by_source(self):
+        section = newsletter.build_recent_headlines_section(
+            [
+                {"source": "A", "title": "One", "url": "https://a/1"},
+                {"source": "B", "title": "", "url": ""},
+                {"source": "A", "title": "Two", "url": "https://a/2"},
+            ],
+            {"C": "timeout"},
+        )
+
+        self.assertIn("### A\n- [One](https://a/1)\n- [Two](https://a/2)\n", section)
+        self.assertIn("### B\n- (no title)\n", section)
+        self.assertIn("- **C**: timeout", section)
 
     def test_save_today_markdown_writes_to_expected_path(self):
         with TemporaryDirectory() as tmp_dir:
@@ -113,6 +453,7 @@ Summary paragraph.
 
             self.assertEqual(result, today_path)
             self.assertEqual(today_path.read_text(encoding="utf-8"), "sample")
+            self.assertEqual(list(Path(tmp_dir).iterdir()), [today_path])
 
     def test_compact_previous_month_news_creates_overview_on_first_day(self):
         with TemporaryDirectory() as tmp_dir: